@@ -1,5 +1,6 @@
 import re
 import importlib
+from functools import lru_cache
 
 from enum import Enum
 from dataclasses import dataclass
@@ -11,6 +12,28 @@ _SPHINX_AUTOCLASS_HEADER = ".. autoclass::"
 # This is a special character used in autosummary to render only the api shortname, for
 # example ~module.api_name will render only api_name
 _SPHINX_AUTODOC_SHORTNAME = "~"
+# Matches a line starting with an empty space, used to detect the end of a sphinx block
+_SPHINX_INDENTATION_RE = re.compile(r"\s")
+
+
+@lru_cache(maxsize=None)
+def _get_canonical_name(name: str) -> str:
+    """
+    Resolve the canonical name of an API name. The canonical name depends only on the
+    name, so it is cached to avoid importing and walking the same module chain every
+    time an API is compared or printed.
+    """
+    tokens = name.split(".")
+
+    # convert the name into a python object, by converting the module token by token
+    attribute = importlib.import_module(tokens[0])
+    for token in tokens[1:]:
+        if not hasattr(attribute, token):
+            # return as it is if the name seems malformed
+            return name
+        attribute = getattr(attribute, token)
+
+    return f"{attribute.__module__}.{attribute.__qualname__}"
 
 
 class AnnotationType(Enum):
@@ -60,7 +83,7 @@ class API:
             if not line.strip():
                 # empty lines
                 continue
-            if not re.match(r"\s", line):
+            if not _SPHINX_INDENTATION_RE.match(line):
                 # end of autosummary, \s means empty space, this line is checking if
                 # the line is not empty and not starting with empty space
                 break
@@ -107,24 +130,14 @@ class API:
         for example). This method converts the alias to full name. This is to make sure
         out analysis can be performed on the same set of canonial names.
         """
-        tokens = self.name.split(".")
-
-        # convert the name into a python object, by converting the module token by token
-        attribute = importlib.import_module(tokens[0])
-        for token in tokens[1:]:
-            if not hasattr(attribute, token):
-                # return as it is if the name seems malformed
-                return self.name
-            attribute = getattr(attribute, token)
-
-        return f"{attribute.__module__}.{attribute.__qualname__}"
+        return _get_canonical_name(self.name)
 
     def _is_private_name(self) -> bool:
         """
         Check if this API has a private name. Private names are those that start with
         underscores.
         """
-        name_has_underscore = self.name.split(".")[-1].startswith("_")
+        name_has_underscore = self.name.rpartition(".")[2].startswith("_")
         is_internal = ".internal." in self.name
 
         return name_has_underscore or is_internal
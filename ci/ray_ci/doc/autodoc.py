@@ -11,6 +11,14 @@ from ci.ray_ci.doc.api import (
 
 _SPHINX_CURRENTMODULE_HEADER = ".. currentmodule::"
 _SPHINX_TOCTREE_HEADER = ".. toctree::"
+_SPHINX_DIRECTIVE_RE = re.compile(
+    r"^(?P<directive>\.\. (?:currentmodule|autoclass|autosummary)::)(?P<content>.*)$",
+    re.MULTILINE,
+)
+_SPHINX_BLOCK_END_RE = re.compile(r"^\S", re.MULTILINE)
+_SPHINX_TOCTREE_RE = re.compile(
+    rf"^[^\S\n]*{re.escape(_SPHINX_TOCTREE_HEADER)}[^\S\n]*$", re.MULTILINE
+)
 
 
 class Autodoc:
@@ -58,23 +66,22 @@ class Autodoc:
         dir = os.path.dirname(self._head_rst_file)
         self._autodoc_rsts = [self._head_rst_file]
         with open(self._head_rst_file, "r") as f:
-            line = f.readline()
-            while line:
-                # look for the toctree block
-                if not line.strip() == _SPHINX_TOCTREE_HEADER:
-                    line = f.readline()
-                    continue
-
-                # parse the toctree block
-                line = f.readline()
-                while line:
-                    if line.strip() and not re.match(r"\s", line):
-                        # end of toctree, \s means empty space, this line is checking if
-                        # the line is not empty and not starting with empty space
-                        break
-                    if line.strip().endswith(".rst"):
-                        self._autodoc_rsts.append(os.path.join(dir, line.strip()))
-                    line = f.readline()
+            text = f.read()
+
+        pos = 0
+        while True:
+            # look for the toctree block
+            match = _SPHINX_TOCTREE_RE.search(text, pos)
+            if not match:
+                break
+
+            # parse the toctree block, which ends at the first line that is not empty
+            # and not starting with empty space
+            end = _SPHINX_BLOCK_END_RE.search(text, match.end())
+            pos = end.start() if end else len(text)
+            for line in text[match.end() : pos].splitlines():
+                if line.strip().endswith(".rst"):
+                    self._autodoc_rsts.append(os.path.join(dir, line.strip()))
 
         return self._autodoc_rsts
 
@@ -95,33 +102,26 @@ class Autodoc:
         apis = []
         module = None
         with open(rst_file, "r") as f:
-            line = f.readline()
-            while line:
-                # parse currentmodule block
-                if line.startswith(_SPHINX_CURRENTMODULE_HEADER):
-                    module = line[len(_SPHINX_CURRENTMODULE_HEADER) :].strip()
-
-                # parse autoclass block
-                if line.startswith(_SPHINX_AUTOCLASS_HEADER):
-                    apis.append(API.from_autoclass(line, module))
-
-                # parse autosummary block
-                if line.startswith(_SPHINX_AUTOSUMMARY_HEADER):
-                    doc = line
-                    line = f.readline()
-                    # collect lines until the end of the autosummary block
-                    while line:
-                        doc += line
-                        if line.strip() and not re.match(r"\s", line):
-                            # end of autosummary, \s means empty space, this line is
-                            # checking if the line is not empty and not starting with
-                            # empty space
-                            break
-                        line = f.readline()
-
-                    apis.extend(API.from_autosummary(doc, module))
-                    continue
-
-                line = f.readline()
+            text = f.read()
+
+        # jump directly from one directive to the next instead of scanning every line
+        for match in _SPHINX_DIRECTIVE_RE.finditer(text):
+            directive = match.group("directive")
+
+            # parse currentmodule block
+            if directive == _SPHINX_CURRENTMODULE_HEADER:
+                module = match.group("content").strip()
+
+            # parse autoclass block
+            if directive == _SPHINX_AUTOCLASS_HEADER:
+                apis.append(API.from_autoclass(match.group(0), module))
+
+            # parse autosummary block
+            if directive == _SPHINX_AUTOSUMMARY_HEADER:
+                # the autosummary block ends at the first line that is not empty and
+                # not starting with empty space
+                end = _SPHINX_BLOCK_END_RE.search(text, match.end())
+                doc = text[match.start() : end.start() if end else len(text)]
+                apis.extend(API.from_autosummary(doc, module))
 
         return [api for api in apis if api]
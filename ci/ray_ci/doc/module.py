@@ -1,7 +1,7 @@
 import importlib
 import inspect
 from types import ModuleType
-from typing import List
+from typing import Any, Dict, Iterator, List
 
 from ci.ray_ci.doc.api import API, AnnotationType, CodeType
 
@@ -15,53 +15,64 @@ class Module:
     def __init__(self, module: str):
         self._module = importlib.import_module(module)
         self._visited = set()
-        self._apis = []
+        # APIs keyed by their full name, so that an API reachable from several
+        # modules is only recorded once
+        self._apis: Dict[str, API] = {}
 
     def walk(self) -> None:
         self._walk(self._module)
 
     def get_apis(self) -> List[API]:
         self.walk()
-        return self._apis
+        return list(self._apis.values())
 
     def _walk(self, module: ModuleType) -> None:
         """
         Depth-first search through the module and its children to find annotated classes
-        and functions.
+        and functions. The search keeps an explicit stack of children iterators instead
+        of recursing, so deeply nested modules do not hit the recursion limit.
+        """
+        stack = []
+        self._visit(module, stack)
+        while stack:
+            try:
+                attribute = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            if inspect.ismodule(attribute):
+                self._visit(attribute, stack)
+            if inspect.isclass(attribute):
+                if self._is_api(attribute):
+                    self._add_api(attribute, CodeType.CLASS)
+                self._visit(attribute, stack)
+            if inspect.isfunction(attribute):
+                if self._is_api(attribute):
+                    self._add_api(attribute, CodeType.FUNCTION)
+
+    def _visit(self, module: ModuleType, stack: List[Iterator[Any]]) -> None:
+        """
+        Mark the module as visited and push its children on the stack to be walked.
         """
         if module in self._visited:
             return
-        self._visited.add(module.__hash__)
+        self._visited.add(module)
 
         if not self._is_valid_child(module):
             return
 
-        for child in dir(module):
-            attribute = getattr(module, child)
+        stack.append(getattr(module, child) for child in dir(module))
 
-            if inspect.ismodule(attribute):
-                self._walk(attribute)
-            if inspect.isclass(attribute):
-                if self._is_api(attribute):
-                    self._apis.append(
-                        API(
-                            name=self._fullname(attribute),
-                            annotation_type=self._get_annotation_type(attribute),
-                            code_type=CodeType.CLASS,
-                        )
-                    )
-                self._walk(attribute)
-            if inspect.isfunction(attribute):
-                if self._is_api(attribute):
-                    self._apis.append(
-                        API(
-                            name=self._fullname(attribute),
-                            annotation_type=self._get_annotation_type(attribute),
-                            code_type=CodeType.FUNCTION,
-                        )
-                    )
-
-        return
+    def _add_api(self, module: ModuleType, code_type: CodeType) -> None:
+        name = self._fullname(module)
+        if name in self._apis:
+            return
+        self._apis[name] = API(
+            name=name,
+            annotation_type=self._get_annotation_type(module),
+            code_type=code_type,
+        )
 
     def _fullname(self, module: ModuleType) -> str:
         return f"{module.__module__}.{module.__qualname__}"
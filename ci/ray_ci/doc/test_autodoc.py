@@ -58,5 +58,36 @@ def test_walk():
         )
 
 
+def test_walk_consecutive_directives():
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "head.rst"), "w") as f:
+            f.write(".. toctree::\n\n")
+            f.write("\tapi.rst\n")
+        with open(os.path.join(tmp, "api.rst"), "w") as f:
+            f.write(".. currentmodule:: ci.ray_ci.doc.mock\n")
+            f.write(".. autosummary::\n")
+            f.write("\t:toctree: doc/\n")
+            f.write("\n")
+            f.write("\tmock_function\n")
+            f.write("Some text in between\n")
+            f.write("\tnot_an_api\n")
+            f.write(".. autoclass:: MockClass\n")
+            f.write(".. autosummary::\n")
+            f.write("\tmock_module.mock_w00t")
+
+        autodoc = Autodoc(os.path.join(tmp, "head.rst"))
+        apis = autodoc.get_apis()
+        assert [api.name for api in apis] == [
+            "ci.ray_ci.doc.mock.mock_function",
+            "ci.ray_ci.doc.mock.MockClass",
+            "ci.ray_ci.doc.mock.mock_module.mock_w00t",
+        ]
+        assert [api.code_type for api in apis] == [
+            CodeType.FUNCTION,
+            CodeType.CLASS,
+            CodeType.FUNCTION,
+        ]
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-vv", __file__]))
@@ -16,5 +16,18 @@ def test_walk():
     assert apis[1].code_type.value == CodeType.FUNCTION.value
 
 
+def test_walk_deduplicates_apis():
+    # the mock package re-exports APIs of its mock_module child
+    module = Module("ci.ray_ci.doc.mock")
+    apis = module.get_apis()
+    assert [api.name for api in apis] == [
+        "ci.ray_ci.doc.mock.mock_module.MockClass",
+        "ci.ray_ci.doc.mock.mock_module.mock_function",
+        "ci.ray_ci.doc.mock.mock_module.mock_w00t",
+    ]
+    # walking again does not record the same APIs twice
+    assert len(module.get_apis()) == len(apis)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -27,6 +27,25 @@ def clear_logger(logger: Union[str, logging.Logger]):
     logger.handlers.clear()
 
 
+_worker_module = None
+
+
+def _get_worker_module():
+    """Return the ray._private.worker module, or None if it is not imported yet.
+
+    The module is cached once it is available so that emitting a record doesn't
+    need to import ray and walk its attributes every time. The worker mode itself
+    is still read on every call, since it changes when the worker is connected.
+    """
+    global _worker_module
+    if _worker_module is None:
+        import ray
+
+        if hasattr(ray, "_private") and hasattr(ray._private, "worker"):
+            _worker_module = ray._private.worker
+    return _worker_module
+
+
 class PlainRayHandler(logging.StreamHandler):
     """A plain log handler.
 
@@ -49,69 +68,65 @@ class PlainRayHandler(logging.StreamHandler):
         Args:
             record: Log record to be emitted
         """
-        import ray
-
-        if (
-            hasattr(ray, "_private")
-            and hasattr(ray._private, "worker")
-            and ray._private.worker.global_worker.mode
-            == ray._private.worker.WORKER_MODE
-        ):
+        worker = _get_worker_module()
+        if worker is not None and worker.global_worker.mode == worker.WORKER_MODE:
             self.plain_handler.emit(record)
         else:
             logging._StderrHandler.emit(self, record)
 
 
+# The default Ray logging configuration. It never varies, so it is built once at
+# import time and only handed to dictConfig when logging is configured.
+_DEFAULT_LOGGING_CONFIG = {
+    "version": 1,
+    "formatters": {
+        "plain": {
+            "format": (
+                "%(asctime)s\t%(levelname)s %(filename)s:%(lineno)s -- %(message)s"
+            ),
+        },
+    },
+    "handlers": {
+        "default": {
+            "()": PlainRayHandler,
+            "formatter": "plain",
+        }
+    },
+    "loggers": {
+        # Default ray logger; any log message that gets propagated here will be
+        # logged to the console. Disable propagation, as many users will use
+        # basicConfig to set up a default handler. If so, logs will be
+        # printed twice unless we prevent propagation here.
+        "ray": {
+            "level": "INFO",
+            "handlers": ["default"],
+            "propagate": False,
+        },
+        # Special handling for ray.rllib: only warning-level messages passed through
+        # See https://github.com/ray-project/ray/pull/31858 for related PR
+        "ray.rllib": {
+            "level": "WARN",
+        },
+    },
+    "disable_existing_loggers": False,
+}
+
 logger_initialized = False
 logging_config_lock = threading.Lock()
 
 
 def generate_logging_config():
     """Generate the default Ray logging configuration."""
+    global logger_initialized
+    if logger_initialized:
+        # Logging is only configured once, so skip taking the lock on later calls.
+        return
+
     with logging_config_lock:
-        global logger_initialized
         if logger_initialized:
             return
-        logger_initialized = True
-
-        formatters = {
-            "plain": {
-                "format": (
-                    "%(asctime)s\t%(levelname)s %(filename)s:%(lineno)s -- %(message)s"
-                ),
-            },
-        }
 
-        handlers = {
-            "default": {
-                "()": PlainRayHandler,
-                "formatter": "plain",
-            }
-        }
-
-        loggers = {
-            # Default ray logger; any log message that gets propagated here will be
-            # logged to the console. Disable propagation, as many users will use
-            # basicConfig to set up a default handler. If so, logs will be
-            # printed twice unless we prevent propagation here.
-            "ray": {
-                "level": "INFO",
-                "handlers": ["default"],
-                "propagate": False,
-            },
-            # Special handling for ray.rllib: only warning-level messages passed through
-            # See https://github.com/ray-project/ray/pull/31858 for related PR
-            "ray.rllib": {
-                "level": "WARN",
-            },
-        }
-
-        dictConfig(
-            {
-                "version": 1,
-                "formatters": formatters,
-                "handlers": handlers,
-                "loggers": loggers,
-                "disable_existing_loggers": False,
-            }
-        )
+        dictConfig(_DEFAULT_LOGGING_CONFIG)
+        # Only mark logging as configured once dictConfig has finished, so callers
+        # taking the unlocked fast path never see a partially configured logger.
+        logger_initialized = True
@@ -204,7 +204,12 @@ LogBatch = Dict[str, Any]
 def _canonicalise_log_line(line):
     # Remove words containing numbers or hex, since those tend to differ between
     # workers.
-    return " ".join(x for x in line.split() if not NUMBERS.search(x))
+    words = line.split()
+    if not NUMBERS.search(line):
+        # Most lines have nothing to remove, so scan the line once instead of
+        # running the regex on every word.
+        return " ".join(words)
+    return " ".join(x for x in words if not NUMBERS.search(x))
 
 
 @dataclass
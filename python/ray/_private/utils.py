@@ -5,7 +5,6 @@ import contextlib
 import errno
 import functools
 import importlib
-import inspect
 import json
 import logging
 import multiprocessing
@@ -1069,12 +1068,13 @@ def get_call_location(back: int = 1):
         back: The number of frames to go up the stack, not including this
             function.
     """
-    stack = inspect.stack()
+    # Only the caller frame is needed, so avoid inspect.stack(), which builds
+    # FrameInfo objects (including source context read from disk) for every frame.
     try:
-        frame = stack[back + 1]
-        return f"{frame.filename}:{frame.lineno}"
-    except IndexError:
+        frame = sys._getframe(back + 1)
+    except ValueError:
         return "UNKNOWN"
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
 
 
 def get_ray_doc_version():
@@ -24,6 +24,11 @@ if TYPE_CHECKING:
 # Ray will use this parameter by default to read the tf.examples in batches.
 DEFAULT_BATCH_SIZE = 2048
 
+# Precompiled structs for the TFRecord "length" and "masked_crc32" fields, so the format
+# string is not parsed again for every record.
+_RECORD_LENGTH = struct.Struct("<Q")
+_MASKED_CRC = struct.Struct("<I")
+
 logger = logging.getLogger(__name__)
 
 
@@ -427,7 +432,7 @@ def _read_records(
                 )
 
             # Read "data[length]" field.
-            (data_length,) = struct.unpack("<Q", length_bytes)
+            (data_length,) = _RECORD_LENGTH.unpack(length_bytes)
             if data_length > len(datum_bytes):
                 datum_bytes = datum_bytes.zfill(int(data_length * 1.5))
             datum_bytes_view = memoryview(datum_bytes)[:data_length]
@@ -583,7 +588,7 @@ def _write_record(
 ) -> None:
     record = example.SerializeToString()
     length = len(record)
-    length_bytes = struct.pack("<Q", length)
+    length_bytes = _RECORD_LENGTH.pack(length)
     file.write(length_bytes)
     file.write(_masked_crc(length_bytes))
     file.write(record)
@@ -598,5 +603,5 @@ def _masked_crc(data: bytes) -> bytes:
     crc = crc32c.crc32(data)
     masked = ((crc >> 15) | (crc << 17)) + mask
     masked = np.uint32(masked & np.iinfo(np.uint32).max)
-    masked_bytes = struct.pack("<I", masked)
+    masked_bytes = _MASKED_CRC.pack(masked)
     return masked_bytes
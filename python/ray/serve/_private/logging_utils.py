@@ -2,7 +2,6 @@ import builtins
 import logging
 import os
 import sys
-import traceback
 from typing import Any, Optional, Tuple
 
 import ray
@@ -113,7 +112,7 @@ class ServeLogAttributeRemovalFilter(logging.Filter):
 class ServeFormatter(logging.Formatter):
     """Serve Logging Formatter
 
-    The formatter will generate the log format on the fly based on the field of record.
+    The formatter will pick the log format based on the field of record.
     """
 
     COMPONENT_LOG_FMT = f"%({SERVE_LOG_LEVEL_NAME})s %({SERVE_LOG_TIME})s {{{SERVE_LOG_COMPONENT}}} {{{SERVE_LOG_COMPONENT_ID}}} "  # noqa:E501
@@ -126,6 +125,25 @@ class ServeFormatter(logging.Formatter):
         self.component_log_fmt = ServeFormatter.COMPONENT_LOG_FMT.format(
             component_name=component_name, component_id=component_id
         )
+        # The record format only depends on whether the request id and route are set
+        # on the record, so build a formatter for every variant once instead of
+        # creating one on each record.
+        self.record_formatters = {}
+        for has_request_id in (False, True):
+            for has_route in (False, True):
+                record_formats_attrs = []
+                if has_request_id:
+                    record_formats_attrs.append(
+                        SERVE_LOG_RECORD_FORMAT[SERVE_LOG_REQUEST_ID]
+                    )
+                if has_route:
+                    record_formats_attrs.append(
+                        SERVE_LOG_RECORD_FORMAT[SERVE_LOG_ROUTE]
+                    )
+                record_formats_attrs.append(SERVE_LOG_RECORD_FORMAT[SERVE_LOG_MESSAGE])
+                self.record_formatters[(has_request_id, has_route)] = logging.Formatter(
+                    self.component_log_fmt + " ".join(record_formats_attrs)
+                )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record into the format string.
@@ -136,17 +154,12 @@ class ServeFormatter(logging.Formatter):
             Returns:
                 The formatted log record in string format.
         """
-        record_format = self.component_log_fmt
-        record_formats_attrs = []
-        if SERVE_LOG_REQUEST_ID in record.__dict__:
-            record_formats_attrs.append(SERVE_LOG_RECORD_FORMAT[SERVE_LOG_REQUEST_ID])
-        if SERVE_LOG_ROUTE in record.__dict__:
-            record_formats_attrs.append(SERVE_LOG_RECORD_FORMAT[SERVE_LOG_ROUTE])
-        record_formats_attrs.append(SERVE_LOG_RECORD_FORMAT[SERVE_LOG_MESSAGE])
-        record_format += " ".join(record_formats_attrs)
-
-        # create a formatter using the format string
-        formatter = logging.Formatter(record_format)
+        formatter = self.record_formatters[
+            (
+                SERVE_LOG_REQUEST_ID in record.__dict__,
+                SERVE_LOG_ROUTE in record.__dict__,
+            )
+        ]
 
         # format the log record using the formatter
         return formatter.format(record)
@@ -213,13 +226,16 @@ class StreamToLogger(object):
         Going from the back of the traceback and traverse until it's no longer in
         logging_utils.py or site-packages.
         """
-        reverse_traces = traceback.extract_stack()[::-1]
-        for index, trace in enumerate(reverse_traces):
-            if (
-                "logging_utils.py" not in trace.filename
-                and "site-packages" not in trace.filename
-            ):
+        # Walk the frames directly instead of using traceback.extract_stack(), which
+        # also looks up the source line of every frame on the stack.
+        frame = sys._getframe()
+        index = 0
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if "logging_utils.py" not in filename and "site-packages" not in filename:
                 return index
+            frame = frame.f_back
+            index += 1
         return 1
 
     def write(self, buf: str):
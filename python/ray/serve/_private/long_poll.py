@@ -152,9 +152,12 @@ class LongPollClient:
             self._schedule_to_event_loop(self._poll_next)
             return
 
+        # Use lazy %-formatting so the message (including the client repr) is only
+        # built when debug logging is enabled.
         logger.debug(
-            f"LongPollClient {self} received updates for keys: "
-            f"{list(updates.keys())}.",
+            "LongPollClient %s received updates for keys: %s.",
+            self,
+            list(updates.keys()),
             extra={"log_to_stderr": False},
         )
         for key, update in updates.items():
@@ -400,7 +403,7 @@ class LongPollHost:
     ):
         self.snapshot_ids[object_key] += 1
         self.object_snapshots[object_key] = updated_object
-        logger.debug(f"LongPollHost: Notify change for key {object_key}.")
+        logger.debug("LongPollHost: Notify change for key %s.", object_key)
 
         if object_key in self.notifier_events:
             for event in self.notifier_events.pop(object_key):